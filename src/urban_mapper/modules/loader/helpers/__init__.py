@@ -1,7 +1,9 @@
 from .ensure_coordinate_reference_system import (
     ensure_coordinate_reference_system,
 )
+from .parse_float_strings import parse_float_strings
 
 __all__ = [
     "ensure_coordinate_reference_system",
+    "parse_float_strings",
 ]
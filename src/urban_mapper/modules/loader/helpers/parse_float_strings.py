@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional extra
+    njit = None
+
+# Largest mantissa and power of ten for which `mantissa * 10**exponent` (or the
+# matching division) is exact in double precision, hence correctly rounded.
+_EXACT_MANTISSA_LIMIT = 2**53
+_EXACT_POWER_LIMIT = 22
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _matches_keyword(data, start, end, keyword):
+        if end - start != len(keyword):
+            return False
+        for offset in range(len(keyword)):
+            # Lower-case ASCII letters before comparing.
+            if data[start + offset] | 0x20 != keyword[offset]:
+                return False
+        return True
+
+    @njit(cache=True)
+    def _parse_float(data, start, end, powers_of_ten, nan_keyword, inf_keywords):
+        """Parse `data[start:end]` as a decimal float.
+
+        Returns the parsed value and a status: `0` if it failed to parse, `1` if the
+        value is correctly rounded, `2` if it parsed but must be re-parsed exactly.
+        """
+        while start < end and (data[start] == 32 or 9 <= data[start] <= 13):
+            start += 1
+        while end > start and (data[end - 1] == 32 or 9 <= data[end - 1] <= 13):
+            end -= 1
+        if start == end:
+            return np.nan, 0
+
+        sign = 1.0
+        if data[start] == 43 or data[start] == 45:
+            if data[start] == 45:
+                sign = -1.0
+            start += 1
+        if _matches_keyword(data, start, end, nan_keyword):
+            return np.nan, 1
+        for keyword in inf_keywords:
+            if _matches_keyword(data, start, end, keyword):
+                return sign * np.inf, 1
+
+        mantissa = 0
+        significant_digits = 0
+        digits = 0
+        exponent = 0
+        position = start
+        while position < end and 48 <= data[position] <= 57:
+            if significant_digits < 18:
+                mantissa = mantissa * 10 + (data[position] - 48)
+                if mantissa > 0:
+                    significant_digits += 1
+            else:
+                exponent += 1
+            digits += 1
+            position += 1
+        if position < end and data[position] == 46:
+            position += 1
+            while position < end and 48 <= data[position] <= 57:
+                if significant_digits < 18:
+                    mantissa = mantissa * 10 + (data[position] - 48)
+                    exponent -= 1
+                    if mantissa > 0:
+                        significant_digits += 1
+                digits += 1
+                position += 1
+        if digits == 0:
+            return np.nan, 0
+
+        if position < end and (data[position] == 101 or data[position] == 69):
+            position += 1
+            exponent_sign = 1
+            if position < end and (data[position] == 43 or data[position] == 45):
+                if data[position] == 45:
+                    exponent_sign = -1
+                position += 1
+            if position == end:
+                return np.nan, 0
+            written_exponent = 0
+            while position < end and 48 <= data[position] <= 57:
+                if written_exponent < 100_000:
+                    written_exponent = written_exponent * 10 + (data[position] - 48)
+                position += 1
+            exponent += exponent_sign * written_exponent
+        if position != end:
+            return np.nan, 0
+
+        if mantissa == 0:
+            return sign * 0.0, 1
+        if mantissa <= _EXACT_MANTISSA_LIMIT and abs(exponent) <= _EXACT_POWER_LIMIT:
+            if exponent >= 0:
+                return sign * (mantissa * powers_of_ten[exponent]), 1
+            return sign * (mantissa / powers_of_ten[-exponent]), 1
+        return np.nan, 2
+
+    @njit(parallel=True, cache=True)
+    def _parse_floats(offsets, data, out, status, nan_keyword, inf_keywords):
+        powers_of_ten = np.empty(_EXACT_POWER_LIMIT + 1, dtype=np.float64)
+        powers_of_ten[0] = 1.0
+        for power in range(1, _EXACT_POWER_LIMIT + 1):
+            powers_of_ten[power] = powers_of_ten[power - 1] * 10.0
+        for index in prange(len(out)):
+            out[index], status[index] = _parse_float(
+                data,
+                offsets[index],
+                offsets[index + 1],
+                powers_of_ten,
+                nan_keyword,
+                inf_keywords,
+            )
+
+
+def _parse_chunk(chunk: pa.Array) -> np.ndarray:
+    """Parse one `Arrow` string chunk with the `Numba` kernel."""
+    chunk = chunk.fill_null("")
+    _, offsets_buffer, data_buffer = chunk.buffers()
+    offset_type = np.int64 if pa.types.is_large_string(chunk.type) else np.int32
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)[
+        chunk.offset : chunk.offset + len(chunk) + 1
+    ]
+    data = (
+        np.frombuffer(data_buffer, dtype=np.uint8)
+        if data_buffer is not None
+        else np.empty(0, dtype=np.uint8)
+    )
+
+    out = np.empty(len(chunk), dtype=np.float64)
+    status = np.empty(len(chunk), dtype=np.uint8)
+    _parse_floats(
+        offsets,
+        data,
+        out,
+        status,
+        np.frombuffer(b"nan", dtype=np.uint8),
+        (
+            np.frombuffer(b"inf", dtype=np.uint8),
+            np.frombuffer(b"infinity", dtype=np.uint8),
+        ),
+    )
+    # Rare values beyond the exactly representable fast path are re-parsed in Python.
+    for index in np.flatnonzero(status == 2):
+        try:
+            out[index] = float(chunk[index].as_py())
+        except ValueError:
+            out[index] = np.nan
+    return out
+
+
+def parse_float_strings(values: pa.ChunkedArray) -> pa.Array:
+    """Parse an `Arrow` string column into `float64`, turning invalid values into `NaN`.
+
+    This mirrors `pandas.to_numeric(..., errors="coerce")` for decimal strings. When
+    `Numba` is installed, the raw `Arrow` string buffers are parsed by a compiled
+    kernel running in parallel across cores, instead of converting every value to
+    a Python object first. Without `Numba` (the optional `numba` extra), it falls
+    back to `pandas.to_numeric`. The kernel is compiled on the first call, which
+    takes about two seconds, and is cached on disk for later sessions.
+
+    Args:
+        values: The `Arrow` column to parse, of `string` or `large_string` type.
+
+    Returns:
+        A `float64` `Arrow` array with `NaN` wherever a value is missing or unparsable.
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> parse_float_strings(pa.chunked_array([["40.7", "n/a", None]]))
+        <pyarrow.lib.DoubleArray object at ...>
+        [
+          40.7,
+          nan,
+          nan
+        ]
+    """
+    if njit is None or not (
+        pa.types.is_string(values.type) or pa.types.is_large_string(values.type)
+    ):
+        return pa.array(
+            pd.to_numeric(values.to_pandas(), errors="coerce"), type=pa.float64()
+        )
+    if values.num_chunks == 0:
+        return pa.array([], type=pa.float64())
+    return pa.array(
+        np.concatenate([_parse_chunk(chunk) for chunk in values.chunks]),
+        type=pa.float64(),
+    )
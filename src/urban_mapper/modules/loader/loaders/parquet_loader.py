@@ -1,12 +1,80 @@
+import gc
+import json
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import shapely
 from beartype import beartype
 from pathlib import Path
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, Literal, Dict, Tuple, Iterable, List
 
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import parse_float_strings
 from urban_mapper.config import DEFAULT_CRS
-from urban_mapper.utils import require_attributes
+from urban_mapper.utils import file_exists, require_attributes, cached_crs
+
+
+def _ensure_floating(
+    table: pa.Table, column: str, target_type: pa.DataType = pa.float64()
+) -> pa.Table:
+    """Return `table` with `column` cast to the floating point `target_type`.
+
+    The column is cast by `Arrow`, which is a no-op when already of `target_type`.
+    If that fails (typically for strings with unparsable values), it goes through
+    `parse_float_strings`, which coerces like `pandas.to_numeric` with
+    `errors="coerce"`, so unparsable values become `NaN` as they always have. The
+    `pandas` metadata of the column is updated too, so `to_pandas` does not restore
+    a stale nullable or string dtype on top of the cast.
+    """
+    values = table[column]
+    try:
+        values = pc.cast(values, target_type, safe=False)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        values = pc.cast(parse_float_strings(values), target_type, safe=False)
+    table = table.set_column(table.schema.get_field_index(column), column, values)
+
+    pandas_metadata = table.schema.pandas_metadata
+    if pandas_metadata:
+        dtype_name = np.dtype(target_type.to_pandas_dtype()).name
+        for column_metadata in pandas_metadata["columns"]:
+            if column_metadata["name"] == column:
+                column_metadata.update(
+                    pandas_type=dtype_name, numpy_type=dtype_name, metadata=None
+                )
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, b"pandas": json.dumps(pandas_metadata)}
+        )
+    return table
+
+
+def _table_to_dataframe(
+    table: pa.Table,
+    coordinate_columns: tuple[str, str],
+    target_type: pa.DataType,
+    use_threads: bool,
+) -> pd.DataFrame:
+    """Convert an `Arrow` table to `pandas` with floating point coordinate columns.
+
+    Coordinate columns are brought to floating point within `Arrow` before the
+    conversion to `pandas`, so no `pandas`-level numeric conversion is needed. The
+    table is converted with `self_destruct`, which frees each `Arrow` column as soon
+    as it is converted, provided nothing else references the table. This is why it
+    is a module-level function: the type-checking wrapper around `ParquetLoader`
+    methods would otherwise keep the argument alive, doubling peak memory.
+    """
+    for column in coordinate_columns:
+        table = _ensure_floating(table, column, target_type)
+    return table.to_pandas(
+        split_blocks=True, self_destruct=True, use_threads=use_threads
+    )
+
+
+# Coordinate reference systems whose coordinates `float32` still resolves to about a metre.
+_SINGLE_PRECISION_CRS = frozenset({"EPSG:4326", "EPSG:3857"})
 
 
 @beartype
@@ -17,13 +85,24 @@ class ParquetLoader(LoaderBase):
     with point geometries. It requires latitude and longitude columns to create
     point geometries for each row.
 
+    !!! note "Optional dependency"
+        Latitude and longitude columns stored as strings are parsed by a compiled
+        `Numba` kernel when the `numba` extra is installed, i.e.
+        `pip install "urban-mapper[numba]"`, and by `pandas.to_numeric` otherwise.
+        The kernel is compiled on its first use, which takes about two seconds, and
+        is then cached on disk for later sessions.
+
     Attributes:
-        file_path (Union[str, Path]): Path to the Parquet file to load.
+        file_path (Union[str, Path, List[Union[str, Path]]]): Path to the Parquet file to load, or to a directory of (possibly `hive`-partitioned) Parquet files, or a list of Parquet files, all read as a single dataset with the `pyarrow` engine.
         latitude_column (Optional[str]): Name of the column containing latitude values. Default: `None`
         longitude_column (Optional[str]): Name of the column containing longitude values. Default: `None`
         coordinate_reference_system (str): The coordinate reference system to use. Default: `EPSG:4326`
         engine (str): The engine to use for reading Parquet files. Default: `"pyarrow"`
-        columns (Optional[list[str]]): List of columns to read from the Parquet file. Default: `None`, which reads all columns.
+        columns (Optional[list[str]]): List of columns to read from the Parquet file. The latitude and longitude columns are always read. Default: `None`, which reads all columns.
+        batch_size (int): Maximum number of rows decoded at once when streaming the file with the `pyarrow` engine. Default: `131072`
+        use_threads (bool): Whether the `pyarrow` engine decodes column chunks and converts them to `pandas` on multiple threads. Default: `True`
+        precision (Literal["fp32", "fp64"]): Floating point precision of the latitude and longitude columns. With `"fp32"`, they are stored as `float32` (about a metre of precision) when the coordinate reference system is `EPSG:4326` or `EPSG:3857`, halving their memory; geometries are still built from `float64` values. Any other coordinate reference system keeps `float64`. Default: `"fp64"`
+        filter (Optional[pc.Expression]): Row filter pushed down to the `pyarrow` dataset scan, so that row groups and partitions which cannot match are skipped without being decoded. Requires the `pyarrow` engine. Default: `None`
 
     Examples:
         >>> from urban_mapper.modules.loader import ParquetLoader
@@ -45,32 +124,97 @@ class ParquetLoader(LoaderBase):
         ...     columns=["latitude", "longitude", "value"]
         ... )
         >>> gdf = loader.load_data_from_file()
+        >>>
+        >>> # Only the points within an urban layer's bounding box, from a partitioned dataset.
+        >>> # The bounding box must be expressed in the CRS of the stored coordinates.
+        >>> import pyarrow.compute as pc
+        >>> min_x, min_y, max_x, max_y = streets.get_layer_bounding_box()
+        >>> loader = ParquetLoader(
+        ...     file_path="trips/",
+        ...     latitude_column="lat",
+        ...     longitude_column="lon",
+        ...     filter=(pc.field("lat") >= min_y) & (pc.field("lat") <= max_y)
+        ...     & (pc.field("lon") >= min_x) & (pc.field("lon") <= max_x),
+        ... )
+        >>> gdf = loader.load_data_from_file()
     """
 
+    # Debugging aid: force a garbage collection once the file is loaded, so that memory
+    # profiles of a load are not blurred by intermediate frames awaiting collection.
+    _collect_garbage_after_load: bool = False
+
     def __init__(
         self,
-        file_path: Union[str, Path],
+        file_path: Union[str, Path, List[Union[str, Path]]],
         latitude_column: Optional[str] = None,
         longitude_column: Optional[str] = None,
         coordinate_reference_system: str = DEFAULT_CRS,
         engine: str = "pyarrow",
         columns: Optional[list[str]] = None,
+        batch_size: int = 131_072,
+        use_threads: bool = True,
+        precision: Literal["fp32", "fp64"] = "fp64",
+        filter: Optional[pc.Expression] = None,
     ) -> None:
+        if isinstance(file_path, list) and not file_path:
+            raise ValueError("At least one Parquet file path must be provided.")
         super().__init__(
-            file_path=file_path,
+            file_path=file_path[0] if isinstance(file_path, list) else file_path,
             latitude_column=latitude_column,
             longitude_column=longitude_column,
             coordinate_reference_system=coordinate_reference_system,
         )
+        if isinstance(file_path, list):
+            self.file_path = [Path(path) for path in file_path]
         self.engine = engine
         self.columns = columns
+        self.batch_size = batch_size
+        self.use_threads = use_threads
+        self.precision = precision
+        self.filter = filter
+        self._coordinate_type: pa.DataType = (
+            pa.float32()
+            if precision == "fp32"
+            and coordinate_reference_system.upper() in _SINGLE_PRECISION_CRS
+            else pa.float64()
+        )
+        self._fast_load_supported: Optional[bool] = None
+        self._preview_cache: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+        reads_dataset = filter is not None or isinstance(file_path, list)
+        if reads_dataset and engine != "pyarrow":
+            raise ValueError(
+                "Filters and lists of Parquet files require the 'pyarrow' engine."
+            )
+        if engine == "pyarrow" and (reads_dataset or Path(self.file_path).is_dir()):
+            self._load_impl = self._dataset_load
+        elif (
+            engine == "pyarrow"
+            and columns is not None
+            and self.latitude_column in columns
+            and self.longitude_column in columns
+        ):
+            self._load_impl = self._fast_load
+        else:
+            self._load_impl = self._generic_load
 
     @require_attributes(["latitude_column", "longitude_column"])
     def _load_data_from_file(self) -> gpd.GeoDataFrame:
         """Load data from a `Parquet` file and convert it to a `GeoDataFrame`.
 
-        This method reads a `Parquet` file using `pandas`, validates the latitude and
-        longitude columns, and converts the data to a `GeoDataFrame` with point
+        The loading strategy is picked once, when the loader is created: datasets (a
+        `filter`, a directory or a list of files) are scanned with `pyarrow.dataset`. If
+        `columns` explicitly lists the latitude and longitude columns (the usual set-up
+        of production pipelines with known schemas), a specialised fast path is used.
+        Otherwise, the generic path below applies.
+
+        With the `pyarrow` engine, the file is streamed in batches of at most `batch_size`
+        rows and only the requested columns (plus the latitude and longitude columns) are
+        decoded, on multiple threads unless `use_threads` is `False`. Point geometries
+        are built per batch, so no full-size intermediate `pandas` frame is created
+        before the geometries. The per-batch frames are still alive while they are
+        concatenated, so peak memory is about twice the size of the loaded data. Other
+        engines fall back to `pandas.read_parquet`. Either way, the index stored in the
+        file is restored, and the data is converted to a `GeoDataFrame` with point
         geometries using the specified coordinate reference system.
 
         Returns:
@@ -79,45 +223,411 @@ class ParquetLoader(LoaderBase):
 
         Raises:
             ValueError: If `latitude_column` or `longitude_column` is `None`.
-            ValueError: If the specified latitude or longitude columns are not found in the Parquet file.
+            ValueError: If the specified latitude, longitude or requested columns are not found in the Parquet file.
             IOError: If the Parquet file cannot be read.
         """
+        geodataframe = self._load_impl()
+        if self._collect_garbage_after_load:
+            gc.collect()
+        return geodataframe
+
+    def _generic_load(self) -> gpd.GeoDataFrame:
+        """Load the file through the generic, fully validated path.
+
+        Returns:
+            A `GeoDataFrame` with point geometries built from the coordinate columns.
+
+        Raises:
+            ValueError: If any projected column is not found in the Parquet file.
+        """
+        if self.engine == "pyarrow":
+            return self._load_with_pyarrow()
+        return self._to_geodataframe(self._read_with_pandas())
+
+    def _read_with_pandas(self) -> pd.DataFrame:
+        """Read the projected columns with `pandas.read_parquet` and the configured engine.
+
+        Returns:
+            A `DataFrame` whose latitude and longitude columns are numeric.
+
+        Raises:
+            ValueError: If the latitude or longitude columns are not found in the Parquet file.
+        """
         dataframe = pd.read_parquet(
             self.file_path,
             engine=self.engine,
-            columns=self.columns,
+            columns=self._projected_columns(),
         )
 
-        if self.latitude_column not in dataframe.columns:
-            raise ValueError(
-                f"Column '{self.latitude_column}' not found in the Parquet file."
-            )
-        if self.longitude_column not in dataframe.columns:
-            raise ValueError(
-                f"Column '{self.longitude_column}' not found in the Parquet file."
-            )
+        self._check_coordinate_columns(dataframe.columns)
+        for column in (self.latitude_column, self.longitude_column):
+            if not pd.api.types.is_float_dtype(dataframe[column]):
+                dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce")
+            if pa.types.is_float32(self._coordinate_type):
+                dataframe[column] = dataframe[column].astype(np.float32)
+        return dataframe
+
+    def _dataset(self) -> ds.Dataset:
+        """Open `file_path` as a `pyarrow` dataset of `Parquet` files.
 
-        dataframe[self.latitude_column] = pd.to_numeric(
-            dataframe[self.latitude_column], errors="coerce"
+        Directory paths are discovered recursively, with `hive`-style partition keys
+        (e.g. `year=2024/`) exposed as columns, so filters on them prune whole files.
+
+        Returns:
+            The `pyarrow` dataset, read with the same options as single files.
+        """
+        source = (
+            [str(path) for path in self.file_path]
+            if isinstance(self.file_path, list)
+            else str(self.file_path)
         )
-        dataframe[self.longitude_column] = pd.to_numeric(
-            dataframe[self.longitude_column], errors="coerce"
+        return ds.dataset(
+            source,
+            format=ds.ParquetFileFormat(
+                read_options=ds.ParquetReadOptions(coerce_int96_timestamp_unit="ms"),
+                default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+                    pre_buffer=True
+                ),
+            ),
+            partitioning="hive",
         )
 
-        geodataframe = gpd.GeoDataFrame(
-            dataframe,
-            geometry=gpd.points_from_xy(
-                dataframe[self.longitude_column],
-                dataframe[self.latitude_column],
+    def _dataset_load(self) -> gpd.GeoDataFrame:
+        """Scan the projected columns of the dataset, pushing `filter` down.
+
+        Row groups whose statistics (and partitions whose keys) cannot satisfy `filter`
+        are skipped without being read, and the remaining rows are filtered while
+        scanning, so only matching rows are ever converted to `pandas`.
+
+        Returns:
+            A `GeoDataFrame` with point geometries built from the coordinate columns.
+
+        Raises:
+            ValueError: If any projected column is not found in the dataset.
+        """
+        return self._to_geodataframe(self._read_dataset())
+
+    def _read_dataset(self) -> pd.DataFrame:
+        """Scan the projected, filtered rows of the dataset into `pandas`.
+
+        Returns:
+            A `DataFrame` whose latitude and longitude columns are floating point.
+
+        Raises:
+            ValueError: If any projected column is not found in the dataset.
+        """
+        dataset = self._dataset()
+        self._check_projected_columns(dataset.schema.names)
+        return _table_to_dataframe(
+            dataset.to_table(
+                columns=self._projected_columns(),
+                filter=self.filter,
+                use_threads=self.use_threads,
             ),
-            crs=self.coordinate_reference_system,
+            (self.latitude_column, self.longitude_column),
+            self._coordinate_type,
+            self.use_threads,
+        )
+
+    def _check_coordinate_columns(self, available_columns: Iterable[Any]) -> None:
+        """Check that the latitude and longitude columns are available.
+
+        Args:
+            available_columns: The columns of the file or of the loaded data.
+
+        Raises:
+            ValueError: If the latitude or longitude columns are not found, listing all
+                of the missing ones at once.
+        """
+        available = set(available_columns)
+        missing = [
+            column
+            for column in (self.latitude_column, self.longitude_column)
+            if column not in available
+        ]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in the Parquet file.")
+
+    def _check_projected_columns(self, available_columns: Iterable[Any]) -> None:
+        """Check that every projected column is available, before any data is decoded.
+
+        `PyArrow` readers silently skip some requested columns that are missing from
+        the file, so the requested `columns` are checked against the schema up front,
+        along with the latitude and longitude columns, for every loading path to fail
+        the same way.
+
+        Args:
+            available_columns: The columns of the file or dataset schema.
+
+        Raises:
+            ValueError: If any projected column is not found, listing all of the
+                missing ones at once.
+        """
+        available = set(available_columns)
+        missing = [
+            column
+            for column in self._projected_columns()
+            or (self.latitude_column, self.longitude_column)
+            if column not in available
+        ]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in the Parquet file.")
+
+    def _projected_columns(self) -> Optional[list[str]]:
+        """Columns to read from the file, always including the coordinate columns.
+
+        Returns:
+            The user-requested columns followed by the latitude and longitude columns
+            (without duplicates), or `None` to read every column.
+        """
+        if self.columns is None:
+            return None
+        return list(
+            dict.fromkeys([*self.columns, self.latitude_column, self.longitude_column])
         )
+
+    def _fast_load(self) -> gpd.GeoDataFrame:
+        """Load the file in one `pq.read_table` call when the schema allows it.
+
+        On first use, the file schema is inspected to check that every projected column
+        exists and that both coordinate columns are stored as floating point values;
+        the outcome is memoised. If so,
+        the projected columns are read at once and converted straight to `pandas`,
+        skipping batching and the per-batch validation of the generic path.
+        Otherwise, every load falls back to `_generic_load`.
+
+        Returns:
+            A `GeoDataFrame` with point geometries built from the coordinate columns.
+
+        Raises:
+            ValueError: If any projected column is not found in the Parquet file.
+        """
+        if self._fast_load_supported is None:
+            schema = pq.read_schema(str(self.file_path), memory_map=True)
+            self._check_projected_columns(schema.names)
+            self._fast_load_supported = all(
+                column in schema.names
+                and pa.types.is_floating(schema.field(column).type)
+                for column in (self.latitude_column, self.longitude_column)
+            )
+        if not self._fast_load_supported:
+            return self._generic_load()
+        return self._to_geodataframe(
+            _table_to_dataframe(
+                self._read_table(),
+                (self.latitude_column, self.longitude_column),
+                self._coordinate_type,
+                self.use_threads,
+            )
+        )
+
+    def _read_table(self) -> pa.Table:
+        """Read the projected columns of the whole file into a single `Arrow` table.
+
+        Returns:
+            The `Arrow` table holding the projected columns, as stored in the file,
+            along with the stored index columns so the index matches `pd.read_parquet`.
+        """
+        return pq.read_table(
+            str(self.file_path),
+            columns=self._projected_columns(),
+            memory_map=True,
+            use_threads=self.use_threads,
+            pre_buffer=True,
+            coerce_int96_timestamp_unit="ms",
+            use_pandas_metadata=True,
+        )
+
+    def _load_with_pyarrow(self) -> gpd.GeoDataFrame:
+        """Stream the projected columns of the `Parquet` file with `PyArrow`.
+
+        The file is memory-mapped, so its pages are served from the OS page cache
+        rather than copied into freshly allocated read buffers, which makes repeated
+        loads of the same file cheap. Column chunks are pre-buffered, coalescing the
+        small reads of each row group into a few larger ones, and decoded on multiple
+        threads when `use_threads` is set. Legacy `INT96` timestamps are read at
+        millisecond resolution, so dates outside the nanosecond range do not overflow.
+        The presence of the projected columns is checked against the file schema
+        before any data is decoded. Each batch is then turned into a `GeoDataFrame` on
+        its own, and the batches are concatenated at the end.
+
+        The index recorded in the file's `pandas` metadata is restored, as
+        `pandas.read_parquet` would: index columns are read along with each batch and
+        kept through the concatenation, while a stored `RangeIndex` (which a single
+        batch cannot rebuild) is recreated from its start, stop and step.
+
+        Returns:
+            A `GeoDataFrame` holding the projected columns, indexed as stored in the file.
+
+        Raises:
+            ValueError: If any projected column is not found in the Parquet file.
+        """
+        columns = self._projected_columns()
+        with pa.memory_map(str(self.file_path), "r") as source:
+            with pq.ParquetFile(
+                source, pre_buffer=True, coerce_int96_timestamp_unit="ms"
+            ) as parquet_file:
+                schema = parquet_file.schema_arrow
+                self._check_projected_columns(schema.names)
+                index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+                stored_index_columns = [
+                    column for column in index_columns if isinstance(column, str)
+                ]
+
+                geodataframes = [
+                    self._to_geodataframe(
+                        _table_to_dataframe(
+                            pa.Table.from_batches([batch]),
+                            (self.latitude_column, self.longitude_column),
+                            self._coordinate_type,
+                            self.use_threads,
+                        )
+                    )
+                    for batch in parquet_file.iter_batches(
+                        batch_size=self.batch_size,
+                        columns=columns,
+                        use_threads=self.use_threads,
+                        use_pandas_metadata=True,
+                    )
+                ]
+
+        if not geodataframes:
+            empty_table = schema.empty_table()
+            if columns is not None:
+                empty_table = empty_table.select(
+                    list(dict.fromkeys([*columns, *stored_index_columns]))
+                )
+            return self._to_geodataframe(
+                _table_to_dataframe(
+                    empty_table,
+                    (self.latitude_column, self.longitude_column),
+                    self._coordinate_type,
+                    self.use_threads,
+                )
+            )
+        if stored_index_columns:
+            return pd.concat(geodataframes, copy=False)
+
+        geodataframe = pd.concat(geodataframes, ignore_index=True, copy=False)
+        if index_columns and index_columns[0].get("kind") == "range":
+            range_index = index_columns[0]
+            index = pd.RangeIndex(
+                range_index["start"],
+                range_index["stop"],
+                range_index["step"],
+                name=range_index["name"],
+            )
+            if len(index) == len(geodataframe):
+                geodataframe.index = index
         return geodataframe
 
+    def _to_geodataframe(self, dataframe: pd.DataFrame) -> gpd.GeoDataFrame:
+        """Wrap a `DataFrame` with numeric coordinate columns into a `GeoDataFrame`.
+
+        Point geometries are created in a single vectorised `shapely.points` call on
+        the raw coordinate arrays, bypassing the `gpd.points_from_xy` wrapper. `float32`
+        columns are upcast for `shapely` only and stay single precision in the frame.
+        The parsed `CRS` is cached, so it is not re-parsed for every streamed batch.
+
+        The geometry is built before the wrap, and the `GeoDataFrame` shares the
+        columns of `dataframe` rather than copying them.
+
+        Args:
+            dataframe: The `DataFrame` whose latitude and longitude columns are numeric.
+                It must not be used after this call.
+
+        Returns:
+            A `GeoDataFrame` sharing the data of `dataframe`, with point geometries.
+        """
+        geometry = gpd.GeoSeries(
+            shapely.points(
+                dataframe[self.longitude_column].to_numpy(dtype=np.float64, copy=False),
+                dataframe[self.latitude_column].to_numpy(dtype=np.float64, copy=False),
+            ),
+            index=dataframe.index,
+            crs=cached_crs(self.coordinate_reference_system),
+        )
+        return gpd.GeoDataFrame(dataframe, geometry=geometry, copy=False)
+
+    @file_exists("file_path")
+    @require_attributes(["latitude_column", "longitude_column"])
+    def load_data_as_spatialpandas(self) -> pd.DataFrame:
+        """Load the `Parquet` file into a `spatialpandas.GeoDataFrame` of points.
+
+        Rather than one `shapely` object per row, the points are stored in a
+        `spatialpandas` `PointArray`, backed by a single contiguous buffer of
+        interleaved longitude and latitude values (`16` bytes per point). This suits
+        pipelines that run vectorised spatial operations on very large point sets.
+
+        !!! note "Optional dependency"
+            This method requires the `spatialpandas` package, which is not installed
+            with `UrbanMapper` by default; install it with the `spatialpandas` extra,
+            i.e. `pip install "urban-mapper[spatialpandas]"`. `load_data_from_file` is
+            unaffected and keeps returning a `geopandas.GeoDataFrame`, as expected by
+            the rest of the pipeline.
+
+        !!! warning "No coordinate reference system"
+            `spatialpandas` does not track coordinate reference systems: the points
+            are expressed in the coordinates stored in the file, and
+            `coordinate_reference_system` is not applied.
+
+        Returns:
+            A `spatialpandas.GeoDataFrame` holding the projected columns and a `geometry`
+            column of points built from the longitude and latitude columns.
+
+        Raises:
+            ImportError: If `spatialpandas` is not installed.
+            ValueError: If `latitude_column` or `longitude_column` is `None`.
+            ValueError: If the specified latitude, longitude or requested columns are not found in the Parquet file.
+            ValueError: If the loaded columns already include a `geometry` column (as `GeoParquet` files do); leave it out through `columns`.
+
+        Examples:
+            >>> loader = ParquetLoader("taxi.parquet", latitude_column="lat", longitude_column="lon")
+            >>> sgdf = loader.load_data_as_spatialpandas()
+        """
+        try:
+            from spatialpandas import GeoDataFrame
+            from spatialpandas.geometry import PointArray
+        except ImportError as error:
+            raise ImportError(
+                "Loading into a spatialpandas GeoDataFrame requires the optional "
+                "`spatialpandas` package. Install it with "
+                '`pip install "urban-mapper[spatialpandas]"`.'
+            ) from error
+
+        if self._load_impl == self._dataset_load:
+            dataframe = self._read_dataset()
+        elif self.engine == "pyarrow":
+            self._check_projected_columns(
+                pq.read_schema(str(self.file_path), memory_map=True).names
+            )
+            dataframe = _table_to_dataframe(
+                self._read_table(),
+                (self.latitude_column, self.longitude_column),
+                self._coordinate_type,
+                self.use_threads,
+            )
+        else:
+            dataframe = self._read_with_pandas()
+
+        if "geometry" in dataframe.columns:
+            raise ValueError(
+                "The loaded data already has a 'geometry' column, which the points "
+                "would overwrite. Select the columns to load through `columns`."
+            )
+
+        coordinates = np.empty((len(dataframe), 2), dtype=np.float64)
+        coordinates[:, 0] = dataframe[self.longitude_column].to_numpy(dtype=np.float64)
+        coordinates[:, 1] = dataframe[self.latitude_column].to_numpy(dtype=np.float64)
+        dataframe["geometry"] = PointArray(coordinates.ravel())
+        return GeoDataFrame(dataframe, geometry="geometry")
+
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this `Parquet` loader.
 
-        Creates a summary representation of the loader for quick inspection.
+        Creates a summary representation of the loader for quick inspection. The
+        preview is built once per format and reused for as long as the previewed
+        attributes are unchanged, which keeps repeated notebook refreshes cheap.
 
         Args:
             format: The output format for the preview. Options include:
@@ -128,6 +638,33 @@ class ParquetLoader(LoaderBase):
         Returns:
             A string or dictionary representing the loader, depending on the format.
 
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        key = (
+            self.file_path,
+            self.latitude_column,
+            self.longitude_column,
+            self.engine,
+            tuple(self.columns) if self.columns else None,
+            self.coordinate_reference_system,
+        )
+        cached = self._preview_cache.get(format)
+        if cached is None or cached[0] != key:
+            cached = (key, self._build_preview(format))
+            self._preview_cache[format] = cached
+        preview = cached[1]
+        return dict(preview) if isinstance(preview, dict) else preview
+
+    def _build_preview(self, format: str) -> Any:
+        """Build the preview of this `Parquet` loader in the requested format.
+
+        Args:
+            format: The output format for the preview, either "ascii" or "json".
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
         Raises:
             ValueError: If an unsupported format is requested.
         """
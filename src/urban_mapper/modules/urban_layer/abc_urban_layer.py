@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Dict, Any
 import geopandas as gpd
+import numpy as np
+import shapely
 from beartype import beartype
 from pathlib import Path
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.utils import require_attributes_not_none
 from urban_mapper import logger
 
+# Width, in degrees of longitude, of a UTM zone.
+_UTM_ZONE_WIDTH = 6.0
+
 
 @beartype
 class UrbanLayerBase(ABC):
@@ -29,11 +34,21 @@ class UrbanLayerBase(ABC):
         >>> # This is an abstract class; use concrete implementations like OSMNXStreets
     """
 
+    # Whether `threshold_distance` is measured in metres once geographic data is
+    # projected (e.g. to UTM), rather than in the units of the layer's own CRS.
+    _threshold_distance_in_metres: bool = True
+    # Whether mappings run a nearest spatial join against `_indexed_nearest_target`,
+    # so that its spatial index is worth building as soon as the layer is loaded.
+    _indexes_nearest_join: bool = True
+
     def __init__(self) -> None:
         self.layer: gpd.GeoDataFrame | None = None
         self.mappings: List[Dict[str, object]] = []
         self.coordinate_reference_system: str = DEFAULT_CRS
         self.has_mapped: bool = False
+        self._sindex_cache: Dict[Any, gpd.GeoDataFrame] = {}
+        self._sindex_cache_layer: gpd.GeoDataFrame | None = None
+        self._sindex_bounds: Tuple[float, float, float, float] | None = None
 
     @abstractmethod
     def from_place(self, place_name: str, **kwargs) -> None:
@@ -218,13 +233,19 @@ class UrbanLayerBase(ABC):
             output_column: Name of the column to store the mapping results.
                 If provided, overrides any predefined mappings.
             threshold_distance: Maximum distance (in CRS units) to consider for nearest element.
-                Points beyond this distance will not be mapped.
+                Points beyond this distance will not be mapped. When mappings are processed,
+                points outside the layer's bounding box expanded by each mapping's threshold
+                distance (this argument, or the one given to `with_mapping`) are left
+                unmapped without being passed to `_map_nearest_layer`.
             **kwargs: Additional implementation-specific parameters passed to _map_nearest_layer.
 
         Returns:
             A tuple containing:
             - The updated urban layer `GeoDataFrame` (may be unchanged in some implementations)
-            - The input data `GeoDataFrame` with the output column(s) added containing mapping results
+            - The input data `GeoDataFrame` with the output column(s) added containing mapping results.
+              When mappings are processed, it is a shallow copy of `data`: the output columns are
+              new, but the existing columns share their memory with `data`, so mutate them in place
+              at your own risk.
 
         Raises:
             ValueError: If the layer has not been loaded, if required columns are missing,
@@ -280,8 +301,10 @@ class UrbanLayerBase(ABC):
                 "No mappings defined. Use with_mapping() during layer creation."
             )
 
-        mapped_data = data.copy()
-        for mapping in self.mappings:
+        mapped_data = data.copy(deep=False)
+        last_index = len(self.mappings) - 1
+        for index, mapping in enumerate(self.mappings):
+            is_last = index == last_index
             lon_col = mapping.get("longitude_column", None)
             lat_col = mapping.get("latitude_column", None)
             out_col = mapping.get("output_column", None)
@@ -299,24 +322,245 @@ class UrbanLayerBase(ABC):
                 raise ValueError(
                     "All of longitude_column, latitude_column, and output_column must be specified."
                 )
-            if self.mappings[-1]:
+            if is_last:
                 logger.log(
                     "DEBUG_MID",
                     "INFO: Last mapping, resetting urban layer's index.",
                 )
+            candidates = mapped_data
+            within_reach = None
+            mapping_threshold = mapping_kwargs.get("threshold_distance")
+            if mapping_threshold:
+                within_reach = self._within_threshold_bounding_box(
+                    mapped_data, lon_col, lat_col, float(mapping_threshold)
+                )
+                if within_reach.any() and not within_reach.all():
+                    candidates = mapped_data[within_reach]
+                    # Without a geometry column the subset falls back to a `DataFrame`.
+                    if not isinstance(candidates, gpd.GeoDataFrame):
+                        candidates = gpd.GeoDataFrame(candidates)
+                else:
+                    within_reach = None
             self.layer, temp_mapped = self._map_nearest_layer(
-                mapped_data,
+                candidates,
                 lon_col,
                 lat_col,
                 out_col,
-                _reset_layer_index=(True if mapping == self.mappings[-1] else False),
+                _reset_layer_index=is_last,
                 **mapping_kwargs,
             )
-            mapped_data[out_col] = temp_mapped[out_col]
+            mapped_data[out_col] = self._align_mapped_column(
+                temp_mapped, candidates, out_col, within_reach
+            )
 
         self.has_mapped = True
         return self.layer, mapped_data
 
+    def _align_mapped_column(
+        self,
+        mapped: gpd.GeoDataFrame,
+        candidates: gpd.GeoDataFrame,
+        output_column: str,
+        within_reach: np.ndarray | None,
+    ) -> Any:
+        """Get the values of `output_column` to assign to the full data being mapped.
+
+        Implementations normally return the candidates in their original order, with
+        their index untouched. Once this is verified, the values are assigned by
+        position, skipping the index alignment `pandas` would otherwise perform.
+        If `within_reach` marks the candidates among the full data (when points out
+        of reach were skipped), they are scattered into a `NaN`-filled array, as
+        alignment would leave the skipped points. Any other case (rows dropped or
+        duplicated, index reset, non-numeric values alongside skipped points) falls
+        back to index alignment.
+
+        Args:
+            mapped: The data returned by `_map_nearest_layer`.
+            candidates: The data passed to `_map_nearest_layer`.
+            output_column: The column holding the mapping results.
+            within_reach: Boolean mask of the candidates among the full data, or
+                `None` if every point was a candidate.
+
+        Returns:
+            An array in the row order of the full data (keeping the column's dtype
+            when every point was a candidate), or a `Series` to be aligned on its
+            index.
+        """
+        column = mapped[output_column]
+        if not mapped.index.equals(candidates.index):
+            return column
+        if within_reach is None:
+            return column.array
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf":
+            values = np.full(len(within_reach), np.nan)
+            values[within_reach] = column.to_numpy()
+            return values
+        return column
+
+    def _nearest_join_target(self, layer: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Select the part of the layer that nearest spatial joins are performed against.
+
+        Implementations relying on `gpd.sjoin_nearest` may override this to keep the
+        identifier columns they need from the join result.
+
+        Args:
+            layer: The urban layer, already projected to the CRS used for the join.
+
+        Returns:
+            The `GeoDataFrame` passed as the right-hand side of the spatial join.
+        """
+        return layer[["geometry"]]
+
+    def _indexed_nearest_target(self, crs: Any) -> gpd.GeoDataFrame:
+        """Get the nearest join target in `crs`, with its spatial index already built.
+
+        The layer is projected and its `STRtree` spatial index built once per CRS, then
+        reused by every mapping, instead of being rebuilt by each `gpd.sjoin_nearest`
+        call. The cache is dropped as soon as `layer` is replaced (e.g. by `from_place`
+        or `from_file`).
+
+        Args:
+            crs: The CRS the points are expressed in for the spatial join.
+
+        Returns:
+            The `GeoDataFrame` to use as the right-hand side of `gpd.sjoin_nearest`.
+        """
+        self._sync_index_cache()
+        target = self._sindex_cache.get(crs)
+        if target is None:
+            layer = self.layer if crs == self.layer.crs else self.layer.to_crs(crs)
+            target = self._nearest_join_target(layer)
+            _ = target.sindex  # Built here once; sjoin_nearest reuses it afterwards.
+            self._sindex_cache[crs] = target
+        return target
+
+    def _sync_index_cache(self) -> None:
+        """Drop the spatial indexes and bounds cached for a previous `layer`."""
+        if self._sindex_cache_layer is not self.layer:
+            self._sindex_cache = {}
+            self._sindex_cache_layer = self.layer
+            self._sindex_bounds = None
+
+    def _build_index(self) -> None:
+        """Prepare the spatial index and bounds of the freshly loaded layer.
+
+        The layer's bounds are stored in `_sindex_bounds`, for the bounding-box
+        prefilter of `map_nearest_layer`. For layers mapped through a nearest spatial
+        join, the join target's `STRtree` is built as well, in the CRS the join runs
+        in: the layer's own CRS if it is projected, otherwise its estimated UTM CRS
+        (which points from the same area share). Mappings then find it cached by
+        `_indexed_nearest_target` rather than building it on first use.
+
+        Building the index up front is best-effort. It is skipped for geographic
+        layers wider than a UTM zone, whose data would be projected to another zone,
+        and when no UTM CRS can be estimated or the layer cannot be reprojected (e.g.
+        near the poles). Mappings then build the index they need on first use.
+        """
+        self._sync_index_cache()
+        if self.layer is None or self.layer.empty:
+            return
+        self._sindex_bounds = tuple(float(bound) for bound in self.layer.total_bounds)
+        if not self._indexes_nearest_join or self.layer.crs is None:
+            return
+        try:
+            if self.layer.crs.is_geographic:
+                min_x, _, max_x, _ = self._sindex_bounds
+                if max_x - min_x > _UTM_ZONE_WIDTH:
+                    return
+                crs = self.layer.estimate_utm_crs()
+            else:
+                crs = self.layer.crs
+            self._indexed_nearest_target(crs)
+        except (RuntimeError, ValueError) as error:
+            logger.log(
+                "DEBUG_LOW",
+                f"Spatial index left to be built on first mapping: {error}",
+            )
+
+    def _post_load(self) -> None:
+        """Hook run once the layer has been loaded, e.g. by `UrbanLayerFactory.build`.
+
+        Builds the spatial index up front (see `_build_index`), so that its cost is paid
+        once at load time instead of in the first mapping. Subclasses extending this
+        hook should call `super()._post_load()`.
+        """
+        self._build_index()
+
+    def _within_threshold_bounding_box(
+        self,
+        data: gpd.GeoDataFrame,
+        longitude_column: str,
+        latitude_column: str,
+        threshold_distance: float,
+    ) -> np.ndarray:
+        """Flag the points that may lie within `threshold_distance` of the layer.
+
+        The layer's bounding box is expanded by `threshold_distance` and compared against
+        the raw coordinate columns (and the bounds of the geometry column, if any) with
+        vectorised `NumPy` comparisons. Points outside the expanded box can never be
+        mapped, so they are skipped before the (much more expensive) nearest-neighbour
+        search.
+
+        When the layer is in a geographic CRS and `_threshold_distance_in_metres` is set,
+        the threshold is converted to degrees conservatively (with a 1% margin covering
+        the scale distortion of the projection used for the search).
+
+        Args:
+            data: `GeoDataFrame` containing the points to map.
+            longitude_column: Name of the column containing longitude values.
+            latitude_column: Name of the column containing latitude values.
+            threshold_distance: Maximum distance to consider for the nearest element.
+
+        Returns:
+            A boolean array, `True` for the points that may be mapped.
+        """
+        self._sync_index_cache()
+        min_x, min_y, max_x, max_y = (
+            self._sindex_bounds
+            if self._sindex_bounds is not None
+            else self.get_layer_bounding_box()
+        )
+        margin_x = margin_y = threshold_distance
+        if self._threshold_distance_in_metres and (
+            self.layer.crs is None or self.layer.crs.is_geographic
+        ):
+            margin_y = 1.01 * threshold_distance / 110_574.0
+            furthest_latitude = min(
+                max(abs(min_y - margin_y), abs(max_y + margin_y)), 90.0
+            )
+            cosine = np.cos(np.radians(furthest_latitude))
+            margin_x = (
+                1.01 * threshold_distance / (111_320.0 * cosine)
+                if cosine > 1e-9
+                else np.inf
+            )
+
+        min_x, max_x = min_x - margin_x, max_x + margin_x
+        min_y, max_y = min_y - margin_y, max_y + margin_y
+
+        longitudes = data[longitude_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        latitudes = data[latitude_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        within_reach = (
+            (longitudes >= min_x)
+            & (longitudes <= max_x)
+            & (latitudes >= min_y)
+            & (latitudes <= max_y)
+        )
+
+        # Some implementations map the existing geometry rather than the coordinate
+        # columns, so a point is only skipped if neither of them can be in reach.
+        if "geometry" in data.columns:
+            if data.crs != self.layer.crs:
+                return np.ones(len(data), dtype=bool)
+            bounds = shapely.bounds(data.geometry.to_numpy())
+            within_reach |= (
+                (bounds[:, 2] >= min_x)
+                & (bounds[:, 0] <= max_x)
+                & (bounds[:, 3] >= min_y)
+                & (bounds[:, 1] <= max_y)
+            )
+        return within_reach
+
     @abstractmethod
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this urban layer.
@@ -218,8 +218,8 @@ class UrbanLayerFactory:
         """Build and return the configured `urban layer` instance.
 
         This method creates an instance of the specified `urban layer` class,
-        calls the loading method with the specified arguments, and attaches
-        any mappings that were added.
+        calls the loading method with the specified arguments, prepares the
+        layer's spatial index, and attaches any mappings that were added.
 
         Returns:
             An initialised `urban layer` instance of the specified type,
@@ -247,6 +247,7 @@ class UrbanLayerFactory:
             )
         loading_func = getattr(layer, self.loading_method)
         loading_func(*self.loading_args, **self.loading_kwargs)
+        layer._post_load()
         layer.mappings = self.mappings
         self._instance = layer
         if self._preview is not None:
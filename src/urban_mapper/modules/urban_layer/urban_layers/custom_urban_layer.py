@@ -5,7 +5,7 @@ from beartype import beartype
 
 from urban_mapper.config import DEFAULT_CRS
 from ..abc_urban_layer import UrbanLayerBase
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, cached_crs
 
 
 @beartype
@@ -204,19 +204,19 @@ class CustomUrbanLayer(UrbanLayerBase):
                 geometry=gpd.points_from_xy(
                     dataframe[longitude_column], dataframe[latitude_column]
                 ),
-                crs=self.coordinate_reference_system,
+                crs=cached_crs(self.coordinate_reference_system),
             )
 
         if not dataframe.crs.is_projected:
             utm_crs = dataframe.estimate_utm_crs()
             dataframe = dataframe.to_crs(utm_crs)
-            layer_projected = self.layer.to_crs(utm_crs)
+            layer_projected = self._indexed_nearest_target(utm_crs)
         else:
-            layer_projected = self.layer
+            layer_projected = self._indexed_nearest_target(self.layer.crs)
 
         mapped_data = gpd.sjoin_nearest(
             dataframe,
-            layer_projected[["geometry"]],
+            layer_projected,
             how="left",
             max_distance=threshold_distance,
             distance_col="distance_to_feature",
@@ -3,7 +3,7 @@ import geopandas as gpd
 from pathlib import Path
 from beartype import beartype
 
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, cached_crs
 
 from .admin_features_ import AdminFeatures
 from ..abc_urban_layer import UrbanLayerBase
@@ -298,6 +298,11 @@ class OSMFeatures(UrbanLayerBase):
         """
         raise NotImplementedError("Loading OSM features from file is not supported.")
 
+    def _nearest_join_target(self, layer: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        features_reset = layer.reset_index()
+        unique_id = "osmid" if "osmid" in features_reset.columns else "index"
+        return features_reset[["geometry", unique_id]]
+
     @require_attributes_not_none(
         "layer",
         error_msg="Layer not loaded. Call a loading method (e.g., from_place) first.",
@@ -352,21 +357,19 @@ class OSMFeatures(UrbanLayerBase):
                 geometry=gpd.points_from_xy(
                     dataframe[longitude_column], dataframe[latitude_column]
                 ),
-                crs=self.coordinate_reference_system,
+                crs=cached_crs(self.coordinate_reference_system),
             )
         if not dataframe.crs.is_projected:
             utm_crs = dataframe.estimate_utm_crs()
             dataframe = dataframe.to_crs(utm_crs)
-            layer_projected = self.layer.to_crs(utm_crs)
+            features_reset = self._indexed_nearest_target(utm_crs)
         else:
-            layer_projected = self.layer
-
-        features_reset = layer_projected.reset_index()
+            features_reset = self._indexed_nearest_target(self.layer.crs)
         unique_id = "osmid" if "osmid" in features_reset.columns else "index"
 
         mapped_data = gpd.sjoin_nearest(
             dataframe,
-            features_reset[["geometry", unique_id]],
+            features_reset,
             how="left",
             max_distance=threshold_distance,
             distance_col="distance_to_feature",
@@ -50,6 +50,11 @@ class OSMNXIntersections(UrbanLayerBase):
         >>> intersections.static_render(node_size=5, node_color="red")
     """
 
+    # On an unprojected graph, `nearest_nodes` returns great-circle distances in metres.
+    _threshold_distance_in_metres = True
+    # Nearest elements are found by `OSMnx`, not by a spatial join on the layer.
+    _indexes_nearest_join = False
+
     def __init__(self) -> None:
         """Initialise an empty `OSMNXIntersections` instance.
 
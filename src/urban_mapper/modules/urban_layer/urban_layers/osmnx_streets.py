@@ -179,6 +179,11 @@ class OSMNXStreets(UrbanLayerBase):
         ... )
     """
 
+    # `OSMnx` measures nearest distances in the graph's (unprojected) CRS units.
+    _threshold_distance_in_metres = False
+    # Nearest elements are found by `OSMnx`, not by a spatial join on the layer.
+    _indexes_nearest_join = False
+
     def __init__(self) -> None:
         super().__init__()
         self.network: StreetNetwork | None = None
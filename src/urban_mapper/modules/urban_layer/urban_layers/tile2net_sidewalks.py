@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Tuple, Any
 from beartype import beartype
 
-from urban_mapper.utils import require_attributes_not_none
+from urban_mapper.utils import require_attributes_not_none, cached_crs
 from ..abc_urban_layer import UrbanLayerBase
 
 
@@ -90,6 +90,9 @@ class Tile2NetSidewalks(UrbanLayerBase):
             "Loading sidewalks from place is not yet implemented."
         )
 
+    def _nearest_join_target(self, layer: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        return layer[["geometry", "feature_id"]]
+
     @require_attributes_not_none(
         "layer", error_msg="Layer not loaded. Call from_file() first."
     )
@@ -143,19 +146,19 @@ class Tile2NetSidewalks(UrbanLayerBase):
                 geometry=gpd.points_from_xy(
                     dataframe[longitude_column], dataframe[latitude_column]
                 ),
-                crs=self.coordinate_reference_system,
+                crs=cached_crs(self.coordinate_reference_system),
             )
 
         if not dataframe.crs.is_projected:
             utm_crs = dataframe.estimate_utm_crs()
             dataframe = dataframe.to_crs(utm_crs)
-            layer_projected = self.layer.to_crs(utm_crs)
+            layer_projected = self._indexed_nearest_target(utm_crs)
         else:
-            layer_projected = self.layer
+            layer_projected = self._indexed_nearest_target(self.layer.crs)
 
         mapped_data = gpd.sjoin_nearest(
             dataframe,
-            layer_projected[["geometry", "feature_id"]],
+            layer_projected,
             how="left",
             max_distance=threshold_distance,
             distance_col="distance_to_sidewalk",
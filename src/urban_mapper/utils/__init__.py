@@ -7,6 +7,7 @@ from .helpers import (
     require_single_attribute_value,
     require_attribute_none,
     file_exists,
+    cached_crs,
 )
 from .lazy_mixin import LazyMixin
 
@@ -19,5 +20,6 @@ __all__ = [
     "require_single_attribute_value",
     "require_attribute_none",
     "file_exists",
+    "cached_crs",
     "LazyMixin",
 ]
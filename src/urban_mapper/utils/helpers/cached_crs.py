@@ -0,0 +1,9 @@
+from functools import lru_cache
+from typing import Any
+
+from pyproj import CRS
+
+
+@lru_cache(maxsize=32)
+def cached_crs(crs: Any) -> CRS:
+    return CRS.from_user_input(crs)
@@ -9,9 +9,10 @@ def file_exists(attr_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            path = getattr(self, attr_name)
-            if not Path(path).exists():
-                raise FileNotFoundError(f"File '{path}' does not exist.")
+            paths = getattr(self, attr_name)
+            for path in paths if isinstance(paths, (list, tuple)) else [paths]:
+                if not Path(path).exists():
+                    raise FileNotFoundError(f"File '{path}' does not exist.")
             return func(self, *args, **kwargs)
 
         return wrapper